@@ -1,7 +1,14 @@
+import hashlib
+import io
+import os
+import tempfile
+import time
+import fsspec
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from scipy.signal import lfilter
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
 
 # Set the page configuration
@@ -17,14 +24,46 @@ st.set_page_config(
 data_url = 'https://pancakebreakfaststats.com/wp-content/uploads/2024/09/data_file.xlsx'
 image_url = 'https://pancakebreakfaststats.com/wp-content/uploads/2024/08/017_logo.png'
 
+# Month names indexed by month number - 1
+month_names = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December']
+
+# Local cache for the downloaded workbook and the aggregated monthly dataset
+cache_dir = '/tmp/cc_cache'
+cache_max_age = 60 * 60  # seconds, matches the in-memory cache ttl
+
 # Load and clean the data
-@st.cache
+@st.cache_data(ttl="1h", show_spinner="Loading market data...")
 def load_and_clean_data(url):
-    data = pd.read_excel(url)
+    # The local copy is named after the URL so a new upload isn't served from an older file
+    monthly_path = os.path.join(cache_dir, f"monthly_{hashlib.sha256(url.encode()).hexdigest()[:16]}.parquet")
+
+    # Reuse the monthly dataset from a previous run if it is still fresh, and download again if it can't be read
+    if os.path.exists(monthly_path) and time.time() - os.path.getmtime(monthly_path) < cache_max_age:
+        try:
+            return pd.read_parquet(monthly_path)
+        except (OSError, ValueError):
+            pass
+
+    with fsspec.open(f"filecache::{url}", filecache={'cache_storage': cache_dir, 'expiry_time': cache_max_age}) as f:
+        data = pd.read_excel(f)
     data = clean_data(data)
     # Exclude Lorcana category
     data = data[data['Category'] != 'Lorcana']
-    return data
+
+    # Aggregate market value by month for each category, only this compact table is kept
+    monthly = data.groupby(['Category', 'Date'], observed=True)['market_value'].sum().reset_index()
+
+    # Write to a temporary file first so an interrupted write never leaves a partial copy in place
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.parquet')
+    os.close(fd)
+    try:
+        monthly.to_parquet(temp_path)
+        os.replace(temp_path, monthly_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return monthly
 
 # Function to clean the data
 def clean_data(data):
@@ -36,48 +75,94 @@ def clean_data(data):
     
     # Sort the data by Date
     data = data.sort_values(by='Date').reset_index(drop=True)
-    
+
+    # Downcast numeric columns and store categories as codes to shrink memory
+    data['market_value'] = pd.to_numeric(data['market_value'], downcast='float')
+    data['Year'] = data['Year'].astype('int16')
+    data['Month'] = data['Month'].astype('int8')
+    data['Category'] = data['Category'].astype('category')
+
     return data
 
+# Function to forecast by repeating the last season plus the average seasonal drift, for series too short to fit Holt-Winters
+def seasonal_naive_forecast(data, periods=12, seasonal_periods=12):
+    values = data.to_numpy(dtype=np.float64)
+    season = min(seasonal_periods, len(values))
+    
+    # Residuals of the plain seasonal naive forecast over the history, their mean is the drift per season
+    residuals = values[season:] - values[:-season]
+    drift = residuals.mean() if len(residuals) else 0.0
+    
+    # Each step repeats the matching point of the last season, shifted by one drift per season ahead
+    steps = np.arange(periods)
+    forecast = pd.Series(values[-season:][steps % season] + drift * (steps // season + 1))
+    
+    # Root mean squared residual, so a steady trend still gives a band
+    forecast_std = np.sqrt(np.mean(residuals ** 2)) if len(residuals) else 0.0
+    return forecast, forecast_std
+
 # Function to perform Holt-Winters forecast
 def holt_winters_forecast(data, periods=12):
-    model = ExponentialSmoothing(data, trend='add', seasonal='add', seasonal_periods=12)
-    fit = model.fit()
-    forecast = fit.forecast(periods)
+    # Fitting trend and seasonality needs at least two full seasons
+    if len(data) < 24:
+        forecast, forecast_std = seasonal_naive_forecast(data, periods)
+    else:
+        # Fit on a plain array, the date index is only needed for the forecast output
+        model = ExponentialSmoothing(data.to_numpy(dtype=np.float64), trend='add', seasonal='add', seasonal_periods=12, initialization_method='heuristic', use_boxcox=False)
+        fit = model.fit()
+        forecast = pd.Series(fit.forecast(periods))
+        # Root mean squared in-sample error, from the fitted sum of squared errors
+        forecast_std = np.sqrt(fit.sse / fit.model.nobs)
     
     # Generate a datetime index for the forecast
     last_date = data.index[-1]
-    forecast_index = pd.date_range(start=last_date, periods=periods + 1, freq='M')[1:]
+    forecast_index = pd.date_range(start=last_date + pd.offsets.MonthBegin(1), periods=periods, freq='MS')
     forecast.index = forecast_index
     
     # Calculate confidence intervals manually
-    forecast_std = np.std(fit.resid)
-    conf_int = pd.DataFrame({
-        'lower': forecast - 1.96 * forecast_std,
-        'upper': forecast + 1.96 * forecast_std
-    }, index=forecast_index)
+    values = forecast.to_numpy()
+    band = 1.96 * forecast_std
+    conf_int = pd.DataFrame(np.stack([values - band, values + band], axis=1), index=forecast_index, columns=['lower', 'upper'])
     
     return forecast, conf_int
 
+# Function to calculate an exponential moving average, same as pandas ewm(adjust=False)
+def ewma(values, alpha):
+    # First-order IIR filter y[i] = alpha * x[i] + (1 - alpha) * y[i-1], seeded so y[0] = x[0]
+    return lfilter([alpha], [1.0, -(1 - alpha)], values, zi=[values[0] * (1 - alpha)])[0]
+
 # Function to calculate MACD
 def calculate_macd(data, short_window=12, long_window=26, signal_window=9):
-    short_ema = data.ewm(span=short_window, adjust=False).mean()
-    long_ema = data.ewm(span=long_window, adjust=False).mean()
+    values = data.to_numpy(dtype=np.float64)
+    short_ema = ewma(values, 2 / (short_window + 1))
+    long_ema = ewma(values, 2 / (long_window + 1))
     macd = short_ema - long_ema
-    signal = macd.ewm(span=signal_window, adjust=False).mean()
-    return macd, signal
+    signal = ewma(macd, 2 / (signal_window + 1))
+    return pd.Series(macd, index=data.index, name=data.name), pd.Series(signal, index=data.index, name=data.name)
 
 # Function to bucket MACD trends
 def bucket_macd_trends(macd_diff):
-    conditions = [
-        (macd_diff > 0.02),  # High upward trend
-        (macd_diff > 0.005), # Medium upward trend
-        (macd_diff > -0.005),# Low upward trend
-        (macd_diff > -0.02), # Low downward trend
-        (macd_diff <= -0.02) # High downward trend
-    ]
-    choices = ['High Upward', 'Medium Upward', 'Low Upward', 'Low Downward', 'High Downward']
-    return np.select(conditions, choices, default='Neutral')
+    values = np.asarray(macd_diff)
+    # Bucket edges, each bucket includes its upper edge
+    edges = np.array([-0.02, -0.005, 0.005, 0.02])
+    choices = np.array(['High Downward', 'Low Downward', 'Low Upward', 'Medium Upward', 'High Upward'])
+    buckets = choices[np.digitize(values, edges, right=True)]
+    # Missing values have no trend
+    return np.where(np.isnan(values), 'Neutral', buckets)
+
+# Shading colors for each MACD trend bucket, for the first and second category
+trend_colors = {'High Upward': 'green', 'Medium Upward': 'lightgreen', 'Low Upward': 'yellow', 'Low Downward': 'orange', 'High Downward': 'red'}
+trend_colors_2 = {'High Upward': 'blue', 'Medium Upward': 'lightblue', 'Low Upward': 'cyan', 'Low Downward': 'orange', 'High Downward': 'purple'}
+
+# Function to shade a plot with one span per run of identical MACD trend buckets
+def shade_macd_trends(ax, index, trend_buckets, colors):
+    # Each run starts where the bucket changes and ends where the next run starts
+    starts = np.flatnonzero(np.r_[True, trend_buckets[1:] != trend_buckets[:-1]])
+    ends = np.r_[starts[1:], len(trend_buckets) - 1]
+    for start, end in zip(starts, ends):
+        color = colors.get(trend_buckets[start])
+        if color and start < end:
+            ax.axvspan(index[start], index[end], color=color, alpha=0.3)
 
 # Function to calculate the best time to buy cards
 def calculate_best_buy_time(data):
@@ -85,10 +170,8 @@ def calculate_best_buy_time(data):
     best_month = monthly_avg['market_value'].idxmin()
     return monthly_avg, best_month
 
-# Function to run all analyses for a given category
-def run_analysis(category_data, category_name):
-    # Aggregate data by month
-    monthly_data = category_data.groupby(['Date']).agg({'market_value': 'sum'}).reset_index()
+# Function to run all analyses for a given category, from its monthly aggregated data
+def run_analysis(monthly_data, category_name):
     time_series = monthly_data.set_index('Date')['market_value']
     
     # Perform Holt-Winters forecast
@@ -114,7 +197,7 @@ def run_analysis(category_data, category_name):
     }
 
 # Load and clean the data
-data = load_and_clean_data(data_url)
+monthly = load_and_clean_data(data_url)
 
 # Streamlit app layout
 # Display the image
@@ -122,18 +205,109 @@ st.image(image_url, use_column_width=True)
 
 st.title("CardBoard Compass: Expand Your Collecting Knowledge Through Data")
 
+categories = ['Fortnite', 'Marvel', 'Pokemon', 'Star Wars', 'Magic the Gathering', 'Baseball', 'Basketball', 'Football', 'Hockey', 'Soccer']
+
+# Run the analyses for every category once, cached until the data changes
+@st.cache_data(show_spinner="Fitting models...", max_entries=1, hash_funcs={pd.DataFrame: lambda d: pd.util.hash_pandas_object(d).sum()})
+def precompute_all(monthly):
+    # Split the monthly data by category in a single pass
+    category_slices = dict(tuple(monthly.groupby('Category', observed=True)))
+
+    # Categories missing from the current data are skipped rather than failing the whole app
+    return {category: run_analysis(category_slices[category], category) for category in categories if category in category_slices}
+
+analyses = precompute_all(monthly)
+
+# Only offer the categories that have data
+available_categories = [category for category in categories if category in analyses]
+if not available_categories:
+    st.error("No market data is available right now. Please check back later.")
+    st.stop()
+
 # Filter options
 st.sidebar.header("Filter Options")
-categories = ['Fortnite', 'Marvel', 'Pokemon', 'Star Wars', 'Magic the Gathering', 'Baseball', 'Basketball', 'Football', 'Hockey', 'Soccer']
-selected_category = st.sidebar.selectbox("Select Category", categories)
+selected_category = st.sidebar.selectbox("Select Category", available_categories)
 
 # Add option to compare two categories
 compare = st.sidebar.checkbox("Compare Two Categories")
 if compare:
-    selected_category_2 = st.sidebar.selectbox("Select Second Category", categories)
-
-# Filter the data based on user selection
-filtered_data = data[data['Category'] == selected_category]
+    selected_category_2 = st.sidebar.selectbox("Select Second Category", available_categories)
+
+# Size and resolution of the plots
+figure_options = {'figsize': (7, 3.5), 'dpi': 80, 'tight_layout': True}
+
+# Function to hash a category's time series, used to key the cached plots
+def series_hash(analysis_results):
+    return pd.util.hash_pandas_object(analysis_results['time_series']).sum()
+
+# Function to render a figure to PNG bytes
+def figure_to_png(fig):
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', bbox_inches='tight')
+    return buffer.getvalue()
+
+# Cached plots with trend shading, which the native Streamlit charts can't draw. Only the rendered
+# PNG is cached, and figures are created without pyplot, so no Matplotlib state is shared between sessions.
+@st.cache_data(max_entries=len(categories))
+def build_macd_png(category, data_hash, _analysis_results):
+    fig = Figure(**figure_options)
+    ax = fig.subplots()
+    _analysis_results['macd'].plot(ax=ax, label='MACD')
+    _analysis_results['signal'].plot(ax=ax, label='Signal')
+
+    # Add shading based on trend buckets
+    shade_macd_trends(ax, _analysis_results['macd'].index, _analysis_results['trend_buckets'], trend_colors)
+
+    ax.set_title(f"MACD and Signal Line for {category}")
+    ax.set_ylabel('Value')
+    ax.legend()
+    return figure_to_png(fig)
+
+# Cached comparison plots for a pair of categories
+@st.cache_data(max_entries=len(categories))
+def build_forecast_comparison_png(category, category_2, data_hash, data_hash_2, _analysis_results, _analysis_results_2):
+    fig = Figure(**figure_options)
+    ax = fig.subplots()
+    _analysis_results['time_series'].plot(ax=ax, label=f'{category} Observed')
+    _analysis_results['forecast'].plot(ax=ax, label=f'{category} Forecast')
+    _analysis_results_2['time_series'].plot(ax=ax, label=f'{category_2} Observed', linestyle='--')
+    _analysis_results_2['forecast'].plot(ax=ax, label=f'{category_2} Forecast', linestyle='--')
+    ax.fill_between(_analysis_results['forecast'].index, _analysis_results['conf_int']['lower'], _analysis_results['conf_int']['upper'], color='gray', alpha=0.2)
+    ax.fill_between(_analysis_results_2['forecast'].index, _analysis_results_2['conf_int']['lower'], _analysis_results_2['conf_int']['upper'], color='blue', alpha=0.2)
+    ax.set_title(f"Forecast Comparison between {category} and {category_2}")
+    ax.set_ylabel('Market Value')
+    ax.legend()
+    return figure_to_png(fig)
+
+@st.cache_data(max_entries=len(categories))
+def build_macd_comparison_png(category, category_2, data_hash, data_hash_2, _analysis_results, _analysis_results_2):
+    fig = Figure(**figure_options)
+    ax = fig.subplots()
+    _analysis_results['macd'].plot(ax=ax, label=f'{category} MACD')
+    _analysis_results['signal'].plot(ax=ax, label=f'{category} Signal')
+    _analysis_results_2['macd'].plot(ax=ax, label=f'{category_2} MACD', linestyle='--')
+    _analysis_results_2['signal'].plot(ax=ax, label=f'{category_2} Signal', linestyle='--')
+
+    # Add shading based on trend buckets for both categories
+    shade_macd_trends(ax, _analysis_results['macd'].index, _analysis_results['trend_buckets'], trend_colors)
+    shade_macd_trends(ax, _analysis_results_2['macd'].index, _analysis_results_2['trend_buckets'], trend_colors_2)
+
+    ax.set_title(f"MACD and Signal Line Comparison between {category} and {category_2}")
+    ax.set_ylabel('Value')
+    ax.legend()
+    return figure_to_png(fig)
+
+@st.cache_data(max_entries=len(categories))
+def build_best_buy_comparison_png(category, category_2, data_hash, data_hash_2, _analysis_results, _analysis_results_2):
+    fig = Figure(**figure_options)
+    ax = fig.subplots()
+    _analysis_results['monthly_avg'].plot(kind='bar', ax=ax, color='blue', alpha=0.6, position=0, width=0.4, label=f'{category}')
+    _analysis_results_2['monthly_avg'].plot(kind='bar', ax=ax, color='green', alpha=0.6, position=1, width=0.4, label=f'{category_2}')
+    ax.set_title(f"Best Time to Buy Comparison between {category} and {category_2}")
+    ax.set_xlabel('Month')
+    ax.set_ylabel('Average Market Value')
+    ax.legend()
+    return figure_to_png(fig)
 
 # Explanation of CardBoard Compass
 st.write("Welcome to CardBoard Compass, your guide to navigating the world of trading cards with data and analytics. While analytics are not necessary for collecting, we offer these insights to help collectors who want to deepen their understanding of the market and make informed decisions.")
@@ -157,29 +331,27 @@ st.write("- **Best Time to Buy**: Based on historical data, we will determine th
 
 
 # Run analysis for the first category
-analysis_results = run_analysis(filtered_data, selected_category)
+analysis_results = analyses[selected_category]
+data_hash = series_hash(analysis_results)
 
 # Display results for the first category
 st.subheader(f"Analysis Results for {selected_category}")
 
-# Time series plot with forecast and confidence intervals
-fig, ax = plt.subplots()
-analysis_results['time_series'].plot(ax=ax, label='Observed')
-analysis_results['forecast'].plot(ax=ax, label='Forecast')
-ax.fill_between(analysis_results['forecast'].index, analysis_results['conf_int']['lower'], analysis_results['conf_int']['upper'], color='gray', alpha=0.2)
-ax.set_title(f"12-Month Forecast for {selected_category}")
-ax.set_ylabel('Market Value')
-ax.legend()
-st.pyplot(fig)
+# Time series chart with forecast and confidence intervals
+forecast_chart = pd.concat([
+    analysis_results['time_series'].rename('Observed'),
+    analysis_results['forecast'].rename('Forecast'),
+    analysis_results['conf_int'].rename(columns={'lower': 'Lower Bound', 'upper': 'Upper Bound'})
+], axis=1)
+st.line_chart(forecast_chart)
 
 # Display forecast results in a table
 st.subheader("Forecast Results")
-forecast_table = pd.DataFrame({
-    'Month': analysis_results['forecast'].index.strftime('%Y-%m'),
-    'Forecast': analysis_results['forecast'],
-    'Lower Bound': analysis_results['conf_int']['lower'],
-    'Upper Bound': analysis_results['conf_int']['upper']
-})
+forecast_table = pd.concat([
+    analysis_results['forecast'].rename('Forecast'),
+    analysis_results['conf_int'].rename(columns={'lower': 'Lower Bound', 'upper': 'Upper Bound'})
+], axis=1)
+forecast_table.index = forecast_table.index.strftime('%Y-%m').rename('Month')
 st.write(forecast_table)
 
 # Display statement on the projected percentage change
@@ -203,27 +375,7 @@ else:
 
 # MACD plot with color shading for trend buckets
 st.subheader(f"MACD Analysis for {selected_category}")
-fig, ax = plt.subplots()
-analysis_results['macd'].plot(ax=ax, label='MACD')
-analysis_results['signal'].plot(ax=ax, label='Signal')
-
-# Loop through MACD trends and add shading based on trend buckets
-for i in range(len(analysis_results['trend_buckets']) - 1):  # Loop through to the second-to-last element
-    if analysis_results['trend_buckets'][i] == 'High Upward':
-        ax.axvspan(analysis_results['macd'].index[i], analysis_results['macd'].index[i+1], color='green', alpha=0.3)
-    elif analysis_results['trend_buckets'][i] == 'Medium Upward':
-        ax.axvspan(analysis_results['macd'].index[i], analysis_results['macd'].index[i+1], color='lightgreen', alpha=0.3)
-    elif analysis_results['trend_buckets'][i] == 'Low Upward':
-        ax.axvspan(analysis_results['macd'].index[i], analysis_results['macd'].index[i+1], color='yellow', alpha=0.3)
-    elif analysis_results['trend_buckets'][i] == 'Low Downward':
-        ax.axvspan(analysis_results['macd'].index[i], analysis_results['macd'].index[i+1], color='orange', alpha=0.3)
-    elif analysis_results['trend_buckets'][i] == 'High Downward':
-        ax.axvspan(analysis_results['macd'].index[i], analysis_results['macd'].index[i+1], color='red', alpha=0.3)
-
-ax.set_title(f"MACD and Signal Line for {selected_category}")
-ax.set_ylabel('Value')
-ax.legend()
-st.pyplot(fig)
+st.image(build_macd_png(selected_category, data_hash, analysis_results))
 
 # Display statement on the most recent trend bucket
 recent_trend = analysis_results['trend_buckets'][-1]
@@ -258,15 +410,10 @@ st.write("It's important to note that the MACD trend speaks to the short-term mo
 
 # Best time to buy bar chart
 st.subheader("Best Time to Buy Cards")
-fig, ax = plt.subplots()
-analysis_results['monthly_avg'].plot(kind='bar', ax=ax, legend=False)
-ax.set_title(f"Average Market Value by Month for {selected_category}")
-ax.set_xlabel('Month')
-ax.set_ylabel('Average Market Value')
-st.pyplot(fig)
+st.bar_chart(analysis_results['monthly_avg'].rename(columns={'market_value': 'Average Market Value'}).rename_axis('Month'))
 
 # Enhanced explanation for the best time to buy
-best_month_name = pd.to_datetime(f'{analysis_results["best_month"]}', format='%m').strftime('%B')
+best_month_name = month_names[analysis_results['best_month'] - 1]
 st.subheader(f"Best Time to Buy {selected_category} Cards")
 st.write(f"The analysis of historical market values suggests that the best time to buy cards in the {selected_category} category is in {best_month_name}. During this month, the market tends to experience lower average values, providing an ideal opportunity for collectors to make purchases at more favorable prices.")
 st.write(f"This trend is likely driven by seasonal factors, such as decreased demand or increased supply during {best_month_name}, which results in a temporary dip in prices. For collectors looking to expand their collection, this month offers a strategic advantage to acquire {selected_category} cards before prices potentially rise again.")
@@ -299,8 +446,8 @@ st.write("**Disclaimer:** This is not financial advice. It is an analytics read
 
 # If comparing two categories, run the same analysis for the second category and display comparisons
 if compare:
-    filtered_data_2 = data[data['Category'] == selected_category_2]
-    analysis_results_2 = run_analysis(filtered_data_2, selected_category_2)
+    analysis_results_2 = analyses[selected_category_2]
+    data_hash_2 = series_hash(analysis_results_2)
     
     st.subheader(f"Comparison with {selected_category_2}")
     
@@ -319,74 +466,22 @@ if compare:
     st.write(f"Most recent MACD trend for {selected_category_2}: {recent_trend_2}")
     
     # Comparison of best time to buy
-    best_month_name_2 = pd.to_datetime(f'{analysis_results_2["best_month"]}', format='%m').strftime('%B')
+    best_month_name_2 = month_names[analysis_results_2['best_month'] - 1]
     
     st.write(f"Best time to buy cards in {selected_category}: {best_month_name}")
     st.write(f"Best time to buy cards in {selected_category_2}: {best_month_name_2}")
     
     # Plot comparison of forecasted values
     st.subheader(f"Forecast Comparison for {selected_category} and {selected_category_2}")
-    fig, ax = plt.subplots()
-    analysis_results['time_series'].plot(ax=ax, label=f'{selected_category} Observed')
-    analysis_results['forecast'].plot(ax=ax, label=f'{selected_category} Forecast')
-    analysis_results_2['time_series'].plot(ax=ax, label=f'{selected_category_2} Observed', linestyle='--')
-    analysis_results_2['forecast'].plot(ax=ax, label=f'{selected_category_2} Forecast', linestyle='--')
-    ax.fill_between(analysis_results['forecast'].index, analysis_results['conf_int']['lower'], analysis_results['conf_int']['upper'], color='gray', alpha=0.2)
-    ax.fill_between(analysis_results_2['forecast'].index, analysis_results_2['conf_int']['lower'], analysis_results_2['conf_int']['upper'], color='blue', alpha=0.2)
-    ax.set_title(f"Forecast Comparison between {selected_category} and {selected_category_2}")
-    ax.set_ylabel('Market Value')
-    ax.legend()
-    st.pyplot(fig)
+    st.image(build_forecast_comparison_png(selected_category, selected_category_2, data_hash, data_hash_2, analysis_results, analysis_results_2))
     
     # Comparison of MACD plots
     st.subheader(f"MACD Comparison for {selected_category} and {selected_category_2}")
-    fig, ax = plt.subplots()
-    analysis_results['macd'].plot(ax=ax, label=f'{selected_category} MACD')
-    analysis_results['signal'].plot(ax=ax, label=f'{selected_category} Signal')
-    analysis_results_2['macd'].plot(ax=ax, label=f'{selected_category_2} MACD', linestyle='--')
-    analysis_results_2['signal'].plot(ax=ax, label=f'{selected_category_2} Signal', linestyle='--')
-
-    # Loop through MACD trends for the first category and add shading based on trend buckets
-    for i in range(len(analysis_results['trend_buckets']) - 1):
-        if analysis_results['trend_buckets'][i] == 'High Upward':
-            ax.axvspan(analysis_results['macd'].index[i], analysis_results['macd'].index[i+1], color='green', alpha=0.3)
-        elif analysis_results['trend_buckets'][i] == 'Medium Upward':
-            ax.axvspan(analysis_results['macd'].index[i], analysis_results['macd'].index[i+1], color='lightgreen', alpha=0.3)
-        elif analysis_results['trend_buckets'][i] == 'Low Upward':
-            ax.axvspan(analysis_results['macd'].index[i], analysis_results['macd'].index[i+1], color='yellow', alpha=0.3)
-        elif analysis_results['trend_buckets'][i] == 'Low Downward':
-            ax.axvspan(analysis_results['macd'].index[i], analysis_results['macd'].index[i+1], color='orange', alpha=0.3)
-        elif analysis_results['trend_buckets'][i] == 'High Downward':
-            ax.axvspan(analysis_results['macd'].index[i], analysis_results['macd'].index[i+1], color='red', alpha=0.3)
-
-    # Loop through MACD trends for the second category and add shading based on trend buckets
-    for i in range(len(analysis_results_2['trend_buckets']) - 1):
-        if analysis_results_2['trend_buckets'][i] == 'High Upward':
-            ax.axvspan(analysis_results_2['macd'].index[i], analysis_results_2['macd'].index[i+1], color='blue', alpha=0.3)
-        elif analysis_results_2['trend_buckets'][i] == 'Medium Upward':
-            ax.axvspan(analysis_results_2['macd'].index[i], analysis_results_2['macd'].index[i+1], color='lightblue', alpha=0.3)
-        elif analysis_results_2['trend_buckets'][i] == 'Low Upward':
-            ax.axvspan(analysis_results_2['macd'].index[i], analysis_results_2['macd'].index[i+1], color='cyan', alpha=0.3)
-        elif analysis_results_2['trend_buckets'][i] == 'Low Downward':
-            ax.axvspan(analysis_results_2['macd'].index[i], analysis_results_2['macd'].index[i+1], color='orange', alpha=0.3)
-        elif analysis_results_2['trend_buckets'][i] == 'High Downward':
-            ax.axvspan(analysis_results_2['macd'].index[i], analysis_results_2['macd'].index[i+1], color='purple', alpha=0.3)
-
-    ax.set_title(f"MACD and Signal Line Comparison between {selected_category} and {selected_category_2}")
-    ax.set_ylabel('Value')
-    ax.legend()
-    st.pyplot(fig)
+    st.image(build_macd_comparison_png(selected_category, selected_category_2, data_hash, data_hash_2, analysis_results, analysis_results_2))
 
     # Comparison of best time to buy bar charts
     st.subheader(f"Best Time to Buy Comparison for {selected_category} and {selected_category_2}")
-    fig, ax = plt.subplots()
-    analysis_results['monthly_avg'].plot(kind='bar', ax=ax, color='blue', alpha=0.6, position=0, width=0.4, label=f'{selected_category}')
-    analysis_results_2['monthly_avg'].plot(kind='bar', ax=ax, color='green', alpha=0.6, position=1, width=0.4, label=f'{selected_category_2}')
-    ax.set_title(f"Best Time to Buy Comparison between {selected_category} and {selected_category_2}")
-    ax.set_xlabel('Month')
-    ax.set_ylabel('Average Market Value')
-    ax.legend()
-    st.pyplot(fig)
+    st.image(build_best_buy_comparison_png(selected_category, selected_category_2, data_hash, data_hash_2, analysis_results, analysis_results_2))
 
 # Final Read Out for the selected trading card categories
     st.subheader(f"Final Read Out: {selected_category} vs. {selected_category_2}")
@@ -419,18 +514,16 @@ st.markdown("<h2 style='color:blue;'>Thank You for Using CardBoard Compass</h2>"
 
 st.write("We hope you found CardBoard Compass helpful in expanding your collecting knowledge through data-driven insights. Whether you're a seasoned collector or just starting out, our goal is to provide you with the tools to make informed decisions in the ever-changing world of trading cards.")
 
-st.write("### Use Cases for CardBoard Compass:")
-st.write("- **Market Forecasting:** Understand future market trends with our 12-month forecasts, helping you time your purchases and sales effectively.")
-st.write("- **Short-Term Trend Analysis:** Leverage the MACD analysis to gain insights into the short-term momentum of your favorite trading card categories.")
-st.write("- **Optimal Buying Times:** Identify the best times to buy cards based on historical market value trends, maximizing your investment in the hobby.")
-st.write("- **Category Comparison:** Compare different trading card categories to diversify your collection and make strategic decisions based on market data.")
-
-st.write("### About Pancake Analytics:")
-st.write("Pancake Analytics is a leader in providing cutting-edge data analytics solutions for the collectibles market. Our expertise spans across various domains, offering deep insights into trading cards, comics, and other collectibles. We specialize in helping collectors, investors, and enthusiasts make data-driven decisions to enhance their collections and investments.")
-st.write("Thank you for choosing CardBoard Compass powered by Pancake Analytics. We're here to help you navigate the exciting world of trading cards with confidence and clarity.")
-
+# Use cases and about section, sent as a single markdown element
+about_md = """### Use Cases for CardBoard Compass:
+- **Market Forecasting:** Understand future market trends with our 12-month forecasts, helping you time your purchases and sales effectively.
+- **Short-Term Trend Analysis:** Leverage the MACD analysis to gain insights into the short-term momentum of your favorite trading card categories.
+- **Optimal Buying Times:** Identify the best times to buy cards based on historical market value trends, maximizing your investment in the hobby.
+- **Category Comparison:** Compare different trading card categories to diversify your collection and make strategic decisions based on market data.
 
+### About Pancake Analytics:
+Pancake Analytics is a leader in providing cutting-edge data analytics solutions for the collectibles market. Our expertise spans across various domains, offering deep insights into trading cards, comics, and other collectibles. We specialize in helping collectors, investors, and enthusiasts make data-driven decisions to enhance their collections and investments.
 
-if __name__ == "__main__":
-    # The script will automatically run when you execute it with Streamlit.
-    pass
+Thank you for choosing CardBoard Compass powered by Pancake Analytics. We're here to help you navigate the exciting world of trading cards with confidence and clarity.
+"""
+st.markdown(about_md)